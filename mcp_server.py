@@ -5,12 +5,15 @@ A Model Context Protocol server for executing SQL queries against Oracle Databas
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import sys
+import time
 from typing import Any, Dict, List, Optional, Union
-import traceback
 import os
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 # MCP imports
@@ -27,11 +30,21 @@ from mcp.types import (
 )
 from types import SimpleNamespace
 
-# Oracle database imports
+# Oracle database driver is imported lazily in _ensure_pool so short-lived
+# invocations do not pay for loading it (and its client libraries) upfront
+oracledb = None
+
+# Optional fast JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional async file I/O
 try:
-    import oracledb
+    import aiofiles
 except ImportError:
-    oracledb = None
+    aiofiles = None
 
 # Setup logging
 logging.basicConfig(
@@ -44,13 +57,196 @@ logging.basicConfig(
 )
 logger = logging.getLogger("oracle-mcp-server")
 
+# Shared literal for NULL column values
+_NULL = "NULL"
+
+def _is_select_query(query: str) -> bool:
+    """Check whether a query is a SELECT/WITH statement
+
+    Skips leading whitespace and SQL comments in place, then compares only
+    the first keyword case-insensitively, so large query texts are not
+    copied and upper-cased just to test their prefix.
+    """
+    i = 0
+    n = len(query)
+    while i < n:
+        ch = query[i]
+        if ch in ' \t\r\n':
+            i += 1
+        elif query.startswith('--', i):
+            end = query.find('\n', i + 2)
+            if end == -1:
+                return False
+            i = end + 1
+        elif query.startswith('/*', i):
+            end = query.find('*/', i + 2)
+            if end == -1:
+                return False
+            i = end + 2
+        else:
+            break
+
+    token = query[i:i + 6].upper()
+    if token == 'SELECT':
+        following = query[i + 6:i + 7]
+        return not (following.isalnum() or following == '_')
+    if token[:4] == 'WITH':
+        following = query[i + 4:i + 5]
+        return not (following.isalnum() or following == '_')
+    return False
+
+def _json_dumps(obj) -> str:
+    """Encode to compact JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+def _fmt_datetime(val) -> str:
+    """Format a DATE/TIMESTAMP column value"""
+    if val is None:
+        return _NULL
+    # Same "YYYY-MM-DD HH:MM:SS" output as strftime, but isoformat is
+    # implemented in C and does not re-parse a format string per cell
+    return val.isoformat(sep=' ', timespec='seconds')
+
+def _fmt_str(val) -> str:
+    """Format any other column value"""
+    if val is None:
+        return _NULL
+    return str(val)
+
+def _iter_result_lines(columns, converters, rows):
+    """Yield the formatted result table line by line
+
+    Centralizes line production for execute_sql in one place. Note that
+    str.join still materializes the lines internally, so this is not a
+    memory saving over a list; the incremental structure is what would
+    let results be emitted in chunks if the MCP transport supports it.
+    """
+    header_line = " | ".join(columns)
+    yield f"Query executed successfully. Found {len(rows)} rows."
+    yield ""
+    yield header_line
+    yield "-" * len(header_line)
+    for row in rows:
+        yield " | ".join(conv(val) for conv, val in zip(converters, row))
+
+def _fmt_col(col_name, data_type, length, precision, scale, nullable, default) -> str:
+    """Format one describe_table row; the column shape is fixed by the SQL"""
+    # Format data type
+    if precision and scale:
+        type_info = f"{data_type}({precision},{scale})"
+    elif length and data_type in ('VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR'):
+        type_info = f"{data_type}({length})"
+    else:
+        type_info = data_type
+
+    default_val = str(default) if default else ""
+    return f"{col_name} | {type_info} | {length or ''} | {precision or ''} | {scale or ''} | {nullable} | {default_val}"
+
+def _make_converter(desc):
+    """Pick a per-column value formatter from a cursor description entry"""
+    db_type = desc[1]
+    if db_type in (oracledb.DB_TYPE_DATE, oracledb.DB_TYPE_TIMESTAMP,
+                   oracledb.DB_TYPE_TIMESTAMP_TZ, oracledb.DB_TYPE_TIMESTAMP_LTZ):
+        return _fmt_datetime
+    return _fmt_str
+
+class _ThreadedCursor:
+    """Adapt a synchronous cursor to the awaitable interface handlers use"""
+
+    def __init__(self, cursor):
+        object.__setattr__(self, '_cursor', cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self._cursor.close()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._cursor, name, value)
+
+    async def execute(self, *args):
+        return await asyncio.to_thread(self._cursor.execute, *args)
+
+    async def fetchmany(self, size=None):
+        if size is None:
+            return await asyncio.to_thread(self._cursor.fetchmany)
+        return await asyncio.to_thread(self._cursor.fetchmany, size)
+
+    async def fetchall(self):
+        return await asyncio.to_thread(self._cursor.fetchall)
+
+class _ThreadedConnection:
+    """Adapt a synchronous connection acquired from a sync pool"""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def cursor(self):
+        return _ThreadedCursor(self._connection.cursor())
+
+    async def commit(self):
+        await asyncio.to_thread(self._connection.commit)
+
+class _ThreadedPool:
+    """Run a synchronous connection pool's blocking calls in worker threads
+
+    Fallback for oracledb builds without asyncio support; exposes the same
+    'async with pool.acquire()' interface as AsyncConnectionPool so the
+    handlers do not need separate code paths.
+    """
+
+    def __init__(self, pool):
+        self._pool = pool
+
+    def acquire(self):
+        return _ThreadedAcquireContext(self._pool)
+
+class _ThreadedAcquireContext:
+    """Async context manager returning a _ThreadedConnection"""
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._connection = None
+
+    async def __aenter__(self):
+        self._connection = await asyncio.to_thread(self._pool.acquire)
+        return _ThreadedConnection(self._connection)
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        connection, self._connection = self._connection, None
+        await asyncio.to_thread(self._pool.release, connection)
+
 class OracleMCPServer:
-    """Oracle Database MCP Server"""
+    """Oracle Database MCP Server
+
+    Tool and resource handlers are safe to interleave: each call acquires
+    its own connection from the async pool and shares no cursor state, so
+    concurrent MCP requests run in parallel instead of serializing on a
+    single connection.
+    """
     
     def __init__(self, config_path: str = "config.json"):
         """Initialize the Oracle MCP Server"""
         self.config = self._load_config(config_path)
-        self.connection = None
+        self.pool = None
+        self._pool_lock = asyncio.Lock()
+        # Keep this limit below the pool max so a stampede of tool calls
+        # queues here instead of exhausting the pool
+        self._query_sem = asyncio.Semaphore(self.config["mcp"].get("max_concurrent_queries", 10))
+        self._meta_cache = OrderedDict()
+        self._meta_cache_ttl = self.config["mcp"].get("meta_cache_ttl", 300)
+        self._meta_cache_max_entries = self.config["mcp"].get("meta_cache_max_entries", 128)
+        self._query_cache = OrderedDict()
+        self._query_cache_ttl = self.config["mcp"].get("query_cache_ttl", 60)
+        self._query_cache_max_entries = self.config["mcp"].get("query_cache_max_entries", 64)
+        self._query_cache_max_row_count = self.config["mcp"].get("query_cache_max_row_count", 500)
+        self._schema_file_cache = None
         self.server = Server("oracle-sql-helper")
         self._setup_tools()
         self._setup_resources()
@@ -69,99 +265,103 @@ class OracleMCPServer:
     
     def _setup_tools(self):
         """Setup MCP tools"""
-        
-        @self.server.list_tools()
-        async def handle_list_tools() -> List[Tool]:
-            """List available tools"""
-            return [
-                Tool(
-                    name="execute_sql",
-                    description="Execute SQL query against Oracle database",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "SQL query to execute"
-                            },
-                            "params": {
-                                "type": "array",
-                                "description": "Optional parameters for parameterized queries",
-                                "items": {"type": "string"}
-                            }
+
+        # Tool definitions are immutable; build them once instead of
+        # reallocating the list on every list_tools call
+        self._tools_cache = [
+            Tool(
+                name="execute_sql",
+                description="Execute SQL query against Oracle database",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "SQL query to execute"
                         },
-                        "required": ["query"]
-                    }
-                ),
-                Tool(
-                    name="describe_table",
-                    description="Get table structure and column information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "table_name": {
-                                "type": "string",
-                                "description": "Name of the table to describe"
-                            },
-                            "schema": {
-                                "type": "string",
-                                "description": "Schema name (optional)"
-                            }
+                        "params": {
+                            "type": "array",
+                            "description": "Optional parameters for parameterized queries",
+                            "items": {"type": "string"}
+                        }
+                    },
+                    "required": ["query"]
+                }
+            ),
+            Tool(
+                name="describe_table",
+                description="Get table structure and column information",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the table to describe"
                         },
-                        "required": ["table_name"]
-                    }
-                ),
-                Tool(
-                    name="list_tables",
-                    description="List all tables in the database or specific schema",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "schema": {
-                                "type": "string",
-                                "description": "Schema name to filter tables (optional)"
-                            },
-                            "pattern": {
-                                "type": "string",
-                                "description": "Pattern to match table names (optional)"
-                            }
+                        "schema": {
+                            "type": "string",
+                            "description": "Schema name (optional)"
                         }
-                    }
-                ),
-                Tool(
-                    name="get_table_relationships",
-                    description="Get foreign key relationships for a table",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "table_name": {
-                                "type": "string",
-                                "description": "Name of the table"
-                            },
-                            "schema": {
-                                "type": "string",
-                                "description": "Schema name (optional)"
-                            }
+                    },
+                    "required": ["table_name"]
+                }
+            ),
+            Tool(
+                name="list_tables",
+                description="List all tables in the database or specific schema",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "schema": {
+                            "type": "string",
+                            "description": "Schema name to filter tables (optional)"
                         },
-                        "required": ["table_name"]
+                        "pattern": {
+                            "type": "string",
+                            "description": "Pattern to match table names (optional)"
+                        }
                     }
-                ),
-                Tool(
-                    name="analyze_query_plan",
-                    description="Get execution plan for a SQL query",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "SQL query to analyze"
-                            }
+                }
+            ),
+            Tool(
+                name="get_table_relationships",
+                description="Get foreign key relationships for a table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the table"
                         },
-                        "required": ["query"]
-                    }
-                )
-            ]
-        
+                        "schema": {
+                            "type": "string",
+                            "description": "Schema name (optional)"
+                        }
+                    },
+                    "required": ["table_name"]
+                }
+            ),
+            Tool(
+                name="analyze_query_plan",
+                description="Get execution plan for a SQL query",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "SQL query to analyze"
+                        }
+                    },
+                    "required": ["query"]
+                }
+            )
+        ]
+
+        @self.server.list_tools()
+        async def handle_list_tools() -> List[Tool]:
+            """List available tools"""
+            return self._tools_cache
+
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Handle tool calls"""
@@ -179,31 +379,38 @@ class OracleMCPServer:
                 else:
                     return [TextContent(type="text", text=f"Unknown tool: {name}")]
             except Exception as e:
-                logger.error(f"Error in tool {name}: {e}")
-                logger.error(traceback.format_exc())
+                # Only pay for traceback formatting when debugging; expected
+                # failures (e.g. bad SQL from an agent) stay cheap
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Error in tool %s", name)
+                else:
+                    logger.error("Error in tool %s: %s", name, e)
                 return [TextContent(type="text", text=f"Error executing {name}: {str(e)}")]
     
     def _setup_resources(self):
         """Setup MCP resources"""
-        
+
+        # Resource definitions are immutable; build them once as well
+        self._resources_cache = [
+            Resource(
+                uri="oracle://database/schema",
+                name="Database Schema",
+                description="Complete database schema information",
+                mimeType="application/json"
+            ),
+            Resource(
+                uri="oracle://database/tables",
+                name="Database Tables",
+                description="List of all database tables",
+                mimeType="application/json"
+            )
+        ]
+
         @self.server.list_resources()
         async def handle_list_resources() -> List[Resource]:
             """List available resources"""
-            return [
-                Resource(
-                    uri="oracle://database/schema",
-                    name="Database Schema",
-                    description="Complete database schema information",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="oracle://database/tables",
-                    name="Database Tables",
-                    description="List of all database tables",
-                    mimeType="application/json"
-                )
-            ]
-        
+            return self._resources_cache
+
         @self.server.read_resource()
         async def handle_read_resource(uri: str) -> str:
             """Handle resource reading"""
@@ -218,154 +425,253 @@ class OracleMCPServer:
                 logger.error(f"Error reading resource {uri}: {e}")
                 raise
     
-    async def _connect_database(self):
-        """Connect to Oracle database"""
-        if self.connection is not None:
+    async def _ensure_pool(self):
+        """Create the Oracle async connection pool on first use"""
+        if self.pool is not None:
             return
-            
+
+        global oracledb
         if oracledb is None:
-            raise ImportError("oracledb library not installed. Install with: pip install oracledb")
-        
-        try:
-            db_config = self.config["database"]
-            
-            # Create connection string
-            if db_config.get("service_name"):
-                dsn = f"{db_config['host']}:{db_config['port']}/{db_config['service_name']}"
-            else:
-                dsn = f"{db_config['host']}:{db_config['port']}/{db_config['sid']}"
-            
-            self.connection = oracledb.connect(
-                user=db_config["username"],
-                password=db_config["password"],
-                dsn=dsn
-            )
-            
-            logger.info("Successfully connected to Oracle database")
-            
-        except Exception as e:
-            logger.error(f"Failed to connect to Oracle database: {e}")
-            raise
-    
+            try:
+                import oracledb
+            except ImportError:
+                raise ImportError("oracledb library not installed. Install with: pip install oracledb")
+
+        # Lock so concurrent first calls create only one pool
+        async with self._pool_lock:
+            if self.pool is not None:
+                return
+
+            try:
+                db_config = self.config["database"]
+
+                # Fetch CLOB/BLOB columns directly as str/bytes in the main
+                # fetch instead of as LOB locators that each cost an extra
+                # round-trip to read
+                if db_config.get("fetch_lobs_inline", True):
+                    oracledb.defaults.fetch_lobs = False
+
+                # Create connection string
+                if db_config.get("service_name"):
+                    dsn = f"{db_config['host']}:{db_config['port']}/{db_config['service_name']}"
+                else:
+                    dsn = f"{db_config['host']}:{db_config['port']}/{db_config['sid']}"
+
+                timeout_seconds = self.config["mcp"].get("timeout_seconds", 30)
+
+                pool_kwargs = {
+                    "user": db_config["username"],
+                    "password": db_config["password"],
+                    "dsn": dsn,
+                    "min": 2,
+                    "max": 20,
+                    "increment": 2,
+                    "ping_interval": 60,
+                    "stmtcachesize": 50
+                }
+
+                if hasattr(oracledb, "create_pool_async"):
+                    async def init_session(connection, tag):
+                        connection.call_timeout = timeout_seconds * 1000
+
+                    self.pool = oracledb.create_pool_async(
+                        session_callback=init_session, **pool_kwargs
+                    )
+                    logger.info("Successfully created Oracle connection pool")
+                else:
+                    # Driver build without asyncio support: use a sync pool
+                    # and push its blocking calls onto worker threads so the
+                    # event loop stays responsive
+                    def init_sync_session(connection, tag):
+                        connection.call_timeout = timeout_seconds * 1000
+
+                    self.pool = _ThreadedPool(oracledb.create_pool(
+                        session_callback=init_sync_session, **pool_kwargs
+                    ))
+                    logger.info("Successfully created Oracle connection pool (threaded fallback)")
+
+            except Exception as e:
+                logger.error(f"Failed to create Oracle connection pool: {e}")
+                raise
+
+    @asynccontextmanager
+    async def _acquire_connection(self):
+        """Acquire a pooled connection, bounded by the concurrency limit"""
+        async with self._query_sem:
+            async with self.pool.acquire() as connection:
+                yield connection
+
+    def _meta_cache_get(self, key) -> Optional[str]:
+        """Return a cached metadata result if present and fresh"""
+        entry = self._meta_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, text = entry
+        if time.monotonic() - cached_at >= self._meta_cache_ttl:
+            del self._meta_cache[key]
+            return None
+        self._meta_cache.move_to_end(key)
+        return text
+
+    def _meta_cache_put(self, key, text: str):
+        """Store a formatted metadata result, evicting the oldest entry if full"""
+        self._meta_cache[key] = (time.monotonic(), text)
+        self._meta_cache.move_to_end(key)
+        while len(self._meta_cache) > self._meta_cache_max_entries:
+            self._meta_cache.popitem(last=False)
+
+    def _query_cache_get(self, key) -> Optional[str]:
+        """Return a cached query result if present and fresh"""
+        entry = self._query_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, text = entry
+        if time.monotonic() - cached_at >= self._query_cache_ttl:
+            del self._query_cache[key]
+            return None
+        self._query_cache.move_to_end(key)
+        return text
+
+    def _query_cache_put(self, key, text: str):
+        """Store a formatted query result, evicting the oldest entry if full"""
+        self._query_cache[key] = (time.monotonic(), text)
+        self._query_cache.move_to_end(key)
+        while len(self._query_cache) > self._query_cache_max_entries:
+            self._query_cache.popitem(last=False)
+
     async def _execute_sql(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """Execute SQL query"""
-        await self._connect_database()
-        
         query = arguments["query"]
         params = arguments.get("params", [])
-        
+
+        is_select = _is_select_query(query)
+        if is_select:
+            cache_key = (hashlib.blake2b(query.encode()).digest(), tuple(params))
+            cached = self._query_cache_get(cache_key)
+            if cached is not None:
+                return [TextContent(type="text", text=cached)]
+
+        if self.pool is None:
+            await self._ensure_pool()
+
         try:
-            cursor = self.connection.cursor()
-            
-            # Execute query
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            
-            # Handle different query types
-            if query.strip().upper().startswith(("SELECT", "WITH")):
-                # Fetch results for SELECT queries
-                columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
-                
-                # Limit results
-                max_results = self.config["mcp"].get("max_results", 1000)
-                if len(rows) > max_results:
-                    rows = rows[:max_results]
-                    truncated_msg = f"\n\n(Results truncated to {max_results} rows)"
-                else:
-                    truncated_msg = ""
-                
-                # Format results
-                if rows:
-                    # Create table format
-                    result = f"Query executed successfully. Found {len(rows)} rows.\n\n"
-                    result += " | ".join(columns) + "\n"
-                    result += "-" * (len(" | ".join(columns))) + "\n"
-                    
-                    for row in rows:
-                        formatted_row = []
-                        for val in row:
-                            if val is None:
-                                formatted_row.append("NULL")
-                            elif isinstance(val, (datetime,)):
-                                formatted_row.append(val.strftime("%Y-%m-%d %H:%M:%S"))
-                            else:
-                                formatted_row.append(str(val))
-                        result += " | ".join(formatted_row) + "\n"
-                    
-                    result += truncated_msg
-                else:
-                    result = "Query executed successfully. No rows returned."
-                    
-            else:
-                # For INSERT, UPDATE, DELETE, etc.
-                self.connection.commit()
-                result = f"Query executed successfully. {cursor.rowcount} rows affected."
-            
-            cursor.close()
+            max_results = self.config["mcp"].get("max_results", 1000)
+
+            async with self._acquire_connection() as connection:
+                with connection.cursor() as cursor:
+                    # Fetch in batches bounded by max_results so large result
+                    # sets never fully materialize in memory
+                    cursor.arraysize = min(max_results, 1000)
+                    cursor.prefetchrows = cursor.arraysize + 1
+
+                    # Execute query
+                    if params:
+                        await cursor.execute(query, params)
+                    else:
+                        await cursor.execute(query)
+
+                    # Handle different query types
+                    if is_select:
+                        # Fetch results for SELECT queries, stopping one row
+                        # past the limit so truncation is detectable
+                        columns = [desc[0] for desc in cursor.description]
+                        converters = [_make_converter(desc) for desc in cursor.description]
+                        rows = []
+                        while len(rows) <= max_results:
+                            batch = await cursor.fetchmany(cursor.arraysize)
+                            if not batch:
+                                break
+                            rows.extend(batch)
+
+                        if len(rows) > max_results:
+                            rows = rows[:max_results]
+                            truncated_msg = f"\n\n(Results truncated to {max_results} rows)"
+                        else:
+                            truncated_msg = ""
+
+                        # Format results
+                        if rows:
+                            # Create table format
+                            result = "\n".join(
+                                _iter_result_lines(columns, converters, rows)
+                            ) + "\n" + truncated_msg
+                        else:
+                            result = "Query executed successfully. No rows returned."
+
+                        if len(rows) <= self._query_cache_max_row_count:
+                            self._query_cache_put(cache_key, result)
+
+                    else:
+                        # For INSERT, UPDATE, DELETE, etc.
+                        await connection.commit()
+                        # Coarse but safe: any write may change what cached
+                        # SELECTs would return
+                        self._query_cache.clear()
+                        result = f"Query executed successfully. {cursor.rowcount} rows affected."
+
             return [TextContent(type="text", text=result)]
-            
+
         except Exception as e:
             logger.error(f"Error executing SQL: {e}")
             return [TextContent(type="text", text=f"SQL Error: {str(e)}")]
     
     async def _describe_table(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """Describe table structure"""
-        await self._connect_database()
-        
         table_name = arguments["table_name"].upper()
         schema = arguments.get("schema", "").upper()
-        
+
+        cache_key = ("describe_table", table_name, schema)
+        cached = self._meta_cache_get(cache_key)
+        if cached is not None:
+            return [TextContent(type="text", text=cached)]
+
+        if self.pool is None:
+            await self._ensure_pool()
+
         try:
-            cursor = self.connection.cursor()
-            
-            # Query for column information
-            if schema:
-                query = """
-                SELECT COLUMN_NAME, DATA_TYPE, DATA_LENGTH, DATA_PRECISION, 
-                       DATA_SCALE, NULLABLE, DATA_DEFAULT
-                FROM ALL_TAB_COLUMNS 
-                WHERE TABLE_NAME = :table_name AND OWNER = :schema
-                ORDER BY COLUMN_ID
-                """
-                cursor.execute(query, [table_name, schema])
-            else:
-                query = """
-                SELECT COLUMN_NAME, DATA_TYPE, DATA_LENGTH, DATA_PRECISION, 
-                       DATA_SCALE, NULLABLE, DATA_DEFAULT
-                FROM USER_TAB_COLUMNS 
-                WHERE TABLE_NAME = :table_name
-                ORDER BY COLUMN_ID
-                """
-                cursor.execute(query, [table_name])
-            
-            columns = cursor.fetchall()
-            
+            async with self._acquire_connection() as connection:
+                with connection.cursor() as cursor:
+                    # Metadata results are small; fetch them in one round-trip
+                    cursor.prefetchrows = cursor.arraysize = 200
+
+                    # Query for column information
+                    if schema:
+                        query = """
+                        SELECT COLUMN_NAME, DATA_TYPE, DATA_LENGTH, DATA_PRECISION,
+                               DATA_SCALE, NULLABLE, DATA_DEFAULT
+                        FROM ALL_TAB_COLUMNS
+                        WHERE TABLE_NAME = :table_name AND OWNER = :schema
+                        ORDER BY COLUMN_ID
+                        """
+                        await cursor.execute(query, [table_name, schema])
+                    else:
+                        query = """
+                        SELECT COLUMN_NAME, DATA_TYPE, DATA_LENGTH, DATA_PRECISION,
+                               DATA_SCALE, NULLABLE, DATA_DEFAULT
+                        FROM USER_TAB_COLUMNS
+                        WHERE TABLE_NAME = :table_name
+                        ORDER BY COLUMN_ID
+                        """
+                        await cursor.execute(query, [table_name])
+
+                    columns = await cursor.fetchall()
+
             if not columns:
                 return [TextContent(type="text", text=f"Table {table_name} not found")]
-            
+
             # Format table description
-            result = f"Table: {table_name}\n\n"
-            result += "Column Name | Data Type | Length | Precision | Scale | Nullable | Default\n"
-            result += "-" * 80 + "\n"
-            
-            for col in columns:
-                col_name, data_type, length, precision, scale, nullable, default = col
-                
-                # Format data type
-                if precision and scale:
-                    type_info = f"{data_type}({precision},{scale})"
-                elif length and data_type in ('VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR'):
-                    type_info = f"{data_type}({length})"
-                else:
-                    type_info = data_type
-                
-                default_val = str(default) if default else ""
-                result += f"{col_name} | {type_info} | {length or ''} | {precision or ''} | {scale or ''} | {nullable} | {default_val}\n"
-            
-            cursor.close()
+            header = "Column Name | Data Type | Length | Precision | Scale | Nullable | Default"
+            parts = [
+                f"Table: {table_name}",
+                "",
+                header,
+                "-" * len(header)
+            ]
+
+            parts.extend(_fmt_col(*col) for col in columns)
+
+            result = "\n".join(parts) + "\n"
+            self._meta_cache_put(cache_key, result)
             return [TextContent(type="text", text=result)]
             
         except Exception as e:
@@ -374,14 +680,18 @@ class OracleMCPServer:
     
     async def _list_tables(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """List database tables"""
-        await self._connect_database()
-        
         schema = arguments.get("schema", "").upper()
         pattern = arguments.get("pattern", "")
-        
+
+        cache_key = ("list_tables", schema, pattern)
+        cached = self._meta_cache_get(cache_key)
+        if cached is not None:
+            return [TextContent(type="text", text=cached)]
+
+        if self.pool is None:
+            await self._ensure_pool()
+
         try:
-            cursor = self.connection.cursor()
-            
             if schema:
                 query = "SELECT TABLE_NAME FROM ALL_TABLES WHERE OWNER = :schema"
                 params = [schema]
@@ -396,18 +706,23 @@ class OracleMCPServer:
                     params.append(f"%{pattern.upper()}%")
             
             query += " ORDER BY TABLE_NAME"
-            
-            cursor.execute(query, params)
-            tables = cursor.fetchall()
-            
+
+            async with self._acquire_connection() as connection:
+                with connection.cursor() as cursor:
+                    # Metadata results are small; fetch them in one round-trip
+                    cursor.prefetchrows = cursor.arraysize = 200
+
+                    await cursor.execute(query, params)
+                    tables = await cursor.fetchall()
+
             if not tables:
                 return [TextContent(type="text", text="No tables found")]
-            
-            result = f"Found {len(tables)} tables:\n\n"
-            for table in tables:
-                result += f"- {table[0]}\n"
-            
-            cursor.close()
+
+            parts = [f"Found {len(tables)} tables:", ""]
+            parts.extend(f"- {table[0]}" for table in tables)
+
+            result = "\n".join(parts) + "\n"
+            self._meta_cache_put(cache_key, result)
             return [TextContent(type="text", text=result)]
             
         except Exception as e:
@@ -416,57 +731,71 @@ class OracleMCPServer:
     
     async def _get_table_relationships(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """Get table foreign key relationships"""
-        await self._connect_database()
-        
         table_name = arguments["table_name"].upper()
         schema = arguments.get("schema", "").upper()
-        
+
+        cache_key = ("get_table_relationships", table_name, schema)
+        cached = self._meta_cache_get(cache_key)
+        if cached is not None:
+            return [TextContent(type="text", text=cached)]
+
+        if self.pool is None:
+            await self._ensure_pool()
+
         try:
-            cursor = self.connection.cursor()
-            
-            # Query for foreign keys
-            if schema:
-                query = """
-                SELECT a.CONSTRAINT_NAME, a.COLUMN_NAME, c_pk.TABLE_NAME as REFERENCED_TABLE,
-                       a_pk.COLUMN_NAME as REFERENCED_COLUMN
-                FROM ALL_CONS_COLUMNS a
-                JOIN ALL_CONSTRAINTS c ON a.CONSTRAINT_NAME = c.CONSTRAINT_NAME
-                JOIN ALL_CONSTRAINTS c_pk ON c.R_CONSTRAINT_NAME = c_pk.CONSTRAINT_NAME
-                JOIN ALL_CONS_COLUMNS a_pk ON c_pk.CONSTRAINT_NAME = a_pk.CONSTRAINT_NAME
-                WHERE c.CONSTRAINT_TYPE = 'R'
-                AND a.TABLE_NAME = :table_name
-                AND a.OWNER = :schema
-                ORDER BY a.CONSTRAINT_NAME, a.POSITION
-                """
-                cursor.execute(query, [table_name, schema])
-            else:
-                query = """
-                SELECT a.CONSTRAINT_NAME, a.COLUMN_NAME, c_pk.TABLE_NAME as REFERENCED_TABLE,
-                       a_pk.COLUMN_NAME as REFERENCED_COLUMN
-                FROM USER_CONS_COLUMNS a
-                JOIN USER_CONSTRAINTS c ON a.CONSTRAINT_NAME = c.CONSTRAINT_NAME
-                JOIN USER_CONSTRAINTS c_pk ON c.R_CONSTRAINT_NAME = c_pk.CONSTRAINT_NAME
-                JOIN USER_CONS_COLUMNS a_pk ON c_pk.CONSTRAINT_NAME = a_pk.CONSTRAINT_NAME
-                WHERE c.CONSTRAINT_TYPE = 'R'
-                AND a.TABLE_NAME = :table_name
-                ORDER BY a.CONSTRAINT_NAME, a.POSITION
-                """
-                cursor.execute(query, [table_name])
-            
-            relationships = cursor.fetchall()
-            
+            async with self._acquire_connection() as connection:
+                with connection.cursor() as cursor:
+                    # Metadata results are small; fetch them in one round-trip
+                    cursor.prefetchrows = cursor.arraysize = 200
+
+                    # Query for foreign keys
+                    if schema:
+                        query = """
+                        SELECT a.CONSTRAINT_NAME, a.COLUMN_NAME, c_pk.TABLE_NAME as REFERENCED_TABLE,
+                               a_pk.COLUMN_NAME as REFERENCED_COLUMN
+                        FROM ALL_CONS_COLUMNS a
+                        JOIN ALL_CONSTRAINTS c ON a.CONSTRAINT_NAME = c.CONSTRAINT_NAME
+                        JOIN ALL_CONSTRAINTS c_pk ON c.R_CONSTRAINT_NAME = c_pk.CONSTRAINT_NAME
+                        JOIN ALL_CONS_COLUMNS a_pk ON c_pk.CONSTRAINT_NAME = a_pk.CONSTRAINT_NAME
+                        WHERE c.CONSTRAINT_TYPE = 'R'
+                        AND a.TABLE_NAME = :table_name
+                        AND a.OWNER = :schema
+                        ORDER BY a.CONSTRAINT_NAME, a.POSITION
+                        """
+                        await cursor.execute(query, [table_name, schema])
+                    else:
+                        query = """
+                        SELECT a.CONSTRAINT_NAME, a.COLUMN_NAME, c_pk.TABLE_NAME as REFERENCED_TABLE,
+                               a_pk.COLUMN_NAME as REFERENCED_COLUMN
+                        FROM USER_CONS_COLUMNS a
+                        JOIN USER_CONSTRAINTS c ON a.CONSTRAINT_NAME = c.CONSTRAINT_NAME
+                        JOIN USER_CONSTRAINTS c_pk ON c.R_CONSTRAINT_NAME = c_pk.CONSTRAINT_NAME
+                        JOIN USER_CONS_COLUMNS a_pk ON c_pk.CONSTRAINT_NAME = a_pk.CONSTRAINT_NAME
+                        WHERE c.CONSTRAINT_TYPE = 'R'
+                        AND a.TABLE_NAME = :table_name
+                        ORDER BY a.CONSTRAINT_NAME, a.POSITION
+                        """
+                        await cursor.execute(query, [table_name])
+
+                    relationships = await cursor.fetchall()
+
             if not relationships:
                 return [TextContent(type="text", text=f"No foreign key relationships found for table {table_name}")]
-            
-            result = f"Foreign Key Relationships for {table_name}:\n\n"
-            result += "Constraint Name | Column | Referenced Table | Referenced Column\n"
-            result += "-" * 70 + "\n"
-            
+
+            header = "Constraint Name | Column | Referenced Table | Referenced Column"
+            parts = [
+                f"Foreign Key Relationships for {table_name}:",
+                "",
+                header,
+                "-" * len(header)
+            ]
+
             for rel in relationships:
                 constraint_name, column, ref_table, ref_column = rel
-                result += f"{constraint_name} | {column} | {ref_table} | {ref_column}\n"
-            
-            cursor.close()
+                parts.append(f"{constraint_name} | {column} | {ref_table} | {ref_column}")
+
+            result = "\n".join(parts) + "\n"
+            self._meta_cache_put(cache_key, result)
             return [TextContent(type="text", text=result)]
             
         except Exception as e:
@@ -475,113 +804,166 @@ class OracleMCPServer:
     
     async def _analyze_query_plan(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """Analyze query execution plan"""
-        await self._connect_database()
-        
+        if self.pool is None:
+            await self._ensure_pool()
+
         query = arguments["query"]
-        
+
         try:
-            cursor = self.connection.cursor()
-            
             # Generate unique statement ID
             stmt_id = f"MCP_PLAN_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            
-            # Explain plan
-            explain_query = f"EXPLAIN PLAN SET STATEMENT_ID = '{stmt_id}' FOR {query}"
-            cursor.execute(explain_query)
-            
-            # Get plan
-            plan_query = """
-            SELECT LPAD(' ', 2 * LEVEL) || OPERATION || ' ' || 
-                   NVL(OPTIONS, '') || ' ' || 
-                   NVL(OBJECT_NAME, '') as PLAN_LINE,
-                   COST, CARDINALITY
-            FROM PLAN_TABLE 
-            WHERE STATEMENT_ID = :stmt_id
-            START WITH ID = 0 
-            CONNECT BY PRIOR ID = PARENT_ID 
-            ORDER BY ID
-            """
-            cursor.execute(plan_query, [stmt_id])
-            plan_rows = cursor.fetchall()
-            
-            if not plan_rows:
-                return [TextContent(type="text", text="No execution plan generated")]
-            
-            result = f"Execution Plan for Query:\n{query}\n\n"
-            result += "Operation | Cost | Cardinality\n"
-            result += "-" * 50 + "\n"
-            
-            for row in plan_rows:
-                plan_line, cost, cardinality = row
-                result += f"{plan_line} | {cost or ''} | {cardinality or ''}\n"
-            
-            # Clean up
-            cursor.execute("DELETE FROM PLAN_TABLE WHERE STATEMENT_ID = :stmt_id", [stmt_id])
-            self.connection.commit()
-            
-            cursor.close()
+
+            async with self._acquire_connection() as connection:
+                with connection.cursor() as cursor:
+                    # Explain plan
+                    explain_query = f"EXPLAIN PLAN SET STATEMENT_ID = '{stmt_id}' FOR {query}"
+                    await cursor.execute(explain_query)
+
+                    # Get plan
+                    plan_query = """
+                    SELECT LPAD(' ', 2 * LEVEL) || OPERATION || ' ' ||
+                           NVL(OPTIONS, '') || ' ' ||
+                           NVL(OBJECT_NAME, '') as PLAN_LINE,
+                           COST, CARDINALITY
+                    FROM PLAN_TABLE
+                    WHERE STATEMENT_ID = :stmt_id
+                    START WITH ID = 0
+                    CONNECT BY PRIOR ID = PARENT_ID
+                    ORDER BY ID
+                    """
+                    await cursor.execute(plan_query, [stmt_id])
+                    plan_rows = await cursor.fetchall()
+
+                    if not plan_rows:
+                        return [TextContent(type="text", text="No execution plan generated")]
+
+                    # Start cleanup so its round-trip overlaps with formatting.
+                    # PLAN_TABLE is session-private, so cleanup must stay on
+                    # the same connection that ran the EXPLAIN PLAN. The
+                    # sleep(0) yields to the event loop so the task actually
+                    # issues its DELETE before the synchronous formatting
+                    # loop begins; create_task alone only schedules it.
+                    cleanup_task = asyncio.create_task(self._cleanup_plan_table(connection, stmt_id))
+                    await asyncio.sleep(0)
+
+                    header = "Operation | Cost | Cardinality"
+                    result = f"Execution Plan for Query:\n{query}\n\n"
+                    result += header + "\n"
+                    result += "-" * len(header) + "\n"
+
+                    for row in plan_rows:
+                        plan_line, cost, cardinality = row
+                        result += f"{plan_line} | {cost or ''} | {cardinality or ''}\n"
+
+                    await cleanup_task
+
             return [TextContent(type="text", text=result)]
             
         except Exception as e:
             logger.error(f"Error analyzing query plan: {e}")
             return [TextContent(type="text", text=f"Error analyzing plan: {str(e)}")]
-    
+
+    async def _cleanup_plan_table(self, connection, stmt_id: str):
+        """Remove generated plan rows for a statement ID"""
+        with connection.cursor() as cursor:
+            await cursor.execute("DELETE FROM PLAN_TABLE WHERE STATEMENT_ID = :stmt_id", [stmt_id])
+        await connection.commit()
+
     async def _get_database_schema(self) -> str:
         """Get complete database schema as JSON"""
-        await self._connect_database()
-        
+        if self.pool is None:
+            await self._ensure_pool()
+
         try:
             # Load existing schema index if available
             schema_file = "schema/db_index.json"
             if os.path.exists(schema_file):
-                with open(schema_file, 'r') as f:
-                    return f.read()
-            
+                return await self._read_schema_file(schema_file)
+
             # If not available, generate basic schema info
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT TABLE_NAME FROM USER_TABLES ORDER BY TABLE_NAME")
-            tables = [row[0] for row in cursor.fetchall()]
-            
+            async with self._acquire_connection() as connection:
+                with connection.cursor() as cursor:
+                    await cursor.execute("SELECT TABLE_NAME FROM USER_TABLES ORDER BY TABLE_NAME")
+                    tables = [row[0] for row in await cursor.fetchall()]
+
             schema_info = {
                 "tables": tables,
                 "generated_at": datetime.now().isoformat(),
                 "note": "Basic schema info - load schema/db_index.json for detailed information"
             }
-            
-            cursor.close()
-            return json.dumps(schema_info, indent=2)
+
+            return _json_dumps(schema_info)
             
         except Exception as e:
             logger.error(f"Error getting database schema: {e}")
-            return json.dumps({"error": str(e)})
+            return _json_dumps({"error": str(e)})
     
+    async def _read_schema_file(self, path: str) -> str:
+        """Read the schema index without blocking the event loop
+
+        The file is read in fixed-size chunks so a large index never holds
+        a second full-size transient buffer, and the decoded text is
+        memoized keyed on (mtime, size) so repeat reads are a dict lookup.
+        """
+        stat = os.stat(path)
+        file_key = (stat.st_mtime, stat.st_size)
+        if self._schema_file_cache is not None:
+            cached_key, text = self._schema_file_cache
+            if cached_key == file_key:
+                return text
+
+        chunk_size = 1 << 20
+        chunks = []
+        if aiofiles is not None:
+            async with aiofiles.open(path, 'rb') as f:
+                while True:
+                    chunk = await f.read(chunk_size)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+        else:
+            def read_chunks():
+                with open(path, 'rb') as f:
+                    while True:
+                        chunk = f.read(chunk_size)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+            await asyncio.to_thread(read_chunks)
+
+        text = b"".join(chunks).decode()
+        self._schema_file_cache = (file_key, text)
+        return text
+
     async def _get_database_tables(self) -> str:
         """Get database tables as JSON"""
-        await self._connect_database()
-        
+        if self.pool is None:
+            await self._ensure_pool()
+
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT TABLE_NAME, NUM_ROWS, LAST_ANALYZED 
-                FROM USER_TABLES 
-                ORDER BY TABLE_NAME
-            """)
-            
+            async with self._acquire_connection() as connection:
+                with connection.cursor() as cursor:
+                    await cursor.execute("""
+                        SELECT TABLE_NAME, NUM_ROWS, LAST_ANALYZED
+                        FROM USER_TABLES
+                        ORDER BY TABLE_NAME
+                    """)
+                    rows = await cursor.fetchall()
+
             tables = []
-            for row in cursor.fetchall():
+            for row in rows:
                 table_name, num_rows, last_analyzed = row
                 tables.append({
                     "name": table_name,
                     "row_count": num_rows,
                     "last_analyzed": last_analyzed.isoformat() if last_analyzed else None
                 })
-            
-            cursor.close()
-            return json.dumps({"tables": tables}, indent=2)
+
+            return _json_dumps({"tables": tables})
             
         except Exception as e:
             logger.error(f"Error getting database tables: {e}")
-            return json.dumps({"error": str(e)})
+            return _json_dumps({"error": str(e)})
     
     async def run(self):
         """Run the MCP server"""
@@ -610,9 +992,8 @@ class OracleMCPServer:
                         )
                     )
                 )
-        except Exception as e:
-            logger.error(f"Error in server run: {e}")
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Error in server run")
             raise
 
 def main():